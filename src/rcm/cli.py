@@ -1,10 +1,10 @@
 """CLI entry point for RCM."""
 
-from importlib.metadata import version
 from typing import Optional
 
 import typer
 
+from .commands.daemon import daemon_cmd
 from .commands.list import list_cmd
 from .commands.pull import pull_cmd
 from .commands.restart import restart_cmd
@@ -14,6 +14,8 @@ from .commands.sync import sync_cmd
 
 def version_callback(value: bool) -> None:
     if value:
+        from importlib.metadata import version
+
         print(f"rcm {version('rcm')}")
         raise typer.Exit()
 
@@ -44,6 +46,7 @@ app.command(name="pull")(pull_cmd)
 app.command(name="sync")(sync_cmd)
 app.command(name="status")(status_cmd)
 app.command(name="restart")(restart_cmd)
+app.command(name="daemon")(daemon_cmd)
 
 
 if __name__ == "__main__":
@@ -1,19 +1,32 @@
 """CLI commands for RCM."""
 
-from typing import Optional
+from contextlib import nullcontext
+from typing import ContextManager
 
 import typer
 from rich.console import Console
 
 console = Console()
 
+# Common --config option, built once at import instead of per call site
+CONFIG_OPTION = typer.Option(
+    None,
+    "--config",
+    "-c",
+    metavar="PATH",
+    help="Path to config.yaml",
+)
 
-def config_option() -> Optional[str]:
-    """Common config path option."""
-    return typer.Option(
-        None,
-        "--config",
-        "-c",
-        metavar="PATH",
-        help="Path to config.yaml",
-    )
+
+def status_spinner(message: str) -> ContextManager:
+    """Spinner context for interactive terminals, no-op when piped.
+
+    Rich's status spinner spawns a render thread and writes ANSI frames;
+    when stdout isn't a TTY (CI, pipes) that is pure overhead, so skip it.
+
+    Args:
+        message: Status message to display while the block runs
+    """
+    if console.is_terminal:
+        return console.status(message)
+    return nullcontext()
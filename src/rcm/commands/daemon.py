@@ -0,0 +1,16 @@
+"""Daemon command."""
+
+from . import console
+
+
+def daemon_cmd() -> None:
+    """Run the rcm daemon, holding SSH connections open between commands."""
+    from ..daemon import DAEMON_SOCKET, serve
+
+    console.print(f"[bold]rcm daemon listening on {DAEMON_SOCKET}[/bold]")
+    console.print("[dim]Subsequent rcm commands will reuse its SSH sessions. Ctrl-C to stop.[/dim]")
+    try:
+        serve()
+    except KeyboardInterrupt:
+        console.print()
+        console.print("[yellow]Daemon stopped.[/yellow]")
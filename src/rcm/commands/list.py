@@ -1,19 +1,53 @@
 """List command."""
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.table import Table
 
 from ..config import load_config
-from ..parser import parse_caddyfile, parse_caddyfile_content
+from ..parser import Service, parse_caddyfile, parse_caddyfile_content
+from ..parser_cache import load_cached_content, store_cached_content
 from ..ssh import get_server_connection
-from . import config_option, console
+from . import CONFIG_OPTION, console, status_spinner
+
+
+def _merge_by_name(
+    local: list[Service], remote: list[Service]
+) -> list[tuple[str, Optional[Service], Optional[Service]]]:
+    """Merge two name-sorted service lists in one linear pass.
+
+    Args:
+        local: Services from the local Caddyfile, sorted by name
+        remote: Services from the remote Caddyfile, sorted by name
+
+    Returns:
+        (name, local_svc, remote_svc) tuples in name order, with None on
+        whichever side a service is missing
+    """
+    merged = []
+    li = ri = 0
+    while li < len(local) or ri < len(remote):
+        local_svc = local[li] if li < len(local) else None
+        remote_svc = remote[ri] if ri < len(remote) else None
+
+        if remote_svc is None or (local_svc is not None and local_svc.name < remote_svc.name):
+            merged.append((local_svc.name, local_svc, None))
+            li += 1
+        elif local_svc is None or local_svc.name > remote_svc.name:
+            merged.append((remote_svc.name, None, remote_svc))
+            ri += 1
+        else:
+            merged.append((local_svc.name, local_svc, remote_svc))
+            li += 1
+            ri += 1
+    return merged
 
 
 def list_cmd(
-    config_path: Optional[str] = config_option(),
+    config_path: Optional[str] = CONFIG_OPTION,
     plain: bool = typer.Option(
         False,
         "--plain",
@@ -23,35 +57,44 @@ def list_cmd(
 ) -> None:
     """List all services from local and remote Caddyfile."""
     try:
-        with console.status("[bold]Loading config..."):
+        with status_spinner("[bold]Loading config..."):
             config = load_config(config_path)
 
         local_caddyfile = Path(config.paths.caddyfile).expanduser()
-        local_services: dict[str, object] = {}
-        remote_services: dict[str, object] = {}
 
-        # Parse local Caddyfile if exists
-        if local_caddyfile.exists():
-            with console.status("[bold]Parsing local Caddyfile..."):
-                for svc in parse_caddyfile(str(local_caddyfile)):
-                    local_services[svc.name] = svc
+        def _parse_local() -> list:
+            if not local_caddyfile.exists():
+                return []
+            return parse_caddyfile(str(local_caddyfile))
 
-        # Parse remote Caddyfile
-        with console.status(f"[bold]Fetching remote Caddyfile ({config.server.host})..."):
+        def _fetch_remote() -> list:
             server_conn = get_server_connection(config.server, config.paths.ssh_dir)
             try:
                 remote_content = server_conn.download_content(config.server.caddyfile)
-                for svc in parse_caddyfile_content(remote_content):
-                    remote_services[svc.name] = svc
             except FileNotFoundError:
-                pass  # Remote Caddyfile doesn't exist
+                return []  # Remote Caddyfile doesn't exist
             finally:
                 server_conn.close()
 
-        # Merge all service names
-        all_names = set(local_services.keys()) | set(remote_services.keys())
-
-        if not all_names:
+            remote_parsed = load_cached_content(remote_content)
+            if remote_parsed is None:
+                remote_parsed = parse_caddyfile_content(remote_content)
+                store_cached_content(remote_content, remote_parsed)
+            return remote_parsed
+
+        # The local parse (CPU) and remote fetch (network) are independent,
+        # so run them concurrently and pay only the slower of the two.
+        with status_spinner(f"[bold]Fetching remote Caddyfile ({config.server.host})..."):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                local_future = executor.submit(_parse_local)
+                remote_future = executor.submit(_fetch_remote)
+                local_list = local_future.result()
+                remote_list = remote_future.result()
+
+        # Both lists come back sorted by name, so merge them in one pass
+        merged = _merge_by_name(local_list, remote_list)
+
+        if not merged:
             console.print("[yellow]No services found.[/yellow]")
             console.print(
                 "[dim]Make sure to add comments in format: # service_name: local_addr[/dim]"
@@ -59,27 +102,45 @@ def list_cmd(
             return
 
         if plain:
-            # Plain text output
-            print(f"Services: {len(all_names)}")
-            print()
-            for name in sorted(all_names):
-                local_svc = local_services.get(name)
-                remote_svc = remote_services.get(name)
+            # Plain text output, flushed in a single write
+            out = [f"Services: {len(merged)}", ""]
+            for name, local_svc, remote_svc in merged:
                 svc = local_svc or remote_svc
 
                 local_mark = "✓" if local_svc else "✗"
                 remote_mark = "✓" if remote_svc else "✗"
                 domains_str = ", ".join(svc.domains)
 
-                print(f"{svc.name}")
-                print(f"  Address: {svc.local_addr}")
-                print(f"  VPS Port: {svc.vps_port}")
-                print(f"  Domains: {domains_str}")
-                print(f"  Local: {local_mark}  Remote: {remote_mark}")
-                print()
+                out.append(f"{svc.name}")
+                out.append(f"  Address: {svc.local_addr}")
+                out.append(f"  VPS Port: {svc.vps_port}")
+                out.append(f"  Domains: {domains_str}")
+                out.append(f"  Local: {local_mark}  Remote: {remote_mark}")
+                out.append("")
+            sys.stdout.write("\n".join(out) + "\n")
         else:
-            # Rich table output
-            table = Table(title=f"Services ({len(all_names)} found)")
+            # Rich table output (imported lazily - --plain never needs it)
+            from rich.table import Table
+
+            # Collect all rows first so Rich measures columns once over the
+            # finished batch instead of re-measuring per add_row
+            rows = []
+            for name, local_svc, remote_svc in merged:
+                # Use whichever service exists for display
+                svc = local_svc or remote_svc
+
+                rows.append(
+                    (
+                        svc.name,
+                        svc.local_addr,
+                        str(svc.vps_port),
+                        ", ".join(svc.domains),
+                        "[green]✓[/green]" if local_svc else "[red]✗[/red]",
+                        "[green]✓[/green]" if remote_svc else "[red]✗[/red]",
+                    )
+                )
+
+            table = Table(title=f"Services ({len(merged)} found)")
             table.add_column("Service", style="cyan")
             table.add_column("Local Address", style="green")
             table.add_column("VPS Port", style="yellow")
@@ -87,25 +148,8 @@ def list_cmd(
             table.add_column("Local", style="white")
             table.add_column("Remote", style="white")
 
-            for name in sorted(all_names):
-                local_svc = local_services.get(name)
-                remote_svc = remote_services.get(name)
-
-                # Use whichever service exists for display
-                svc = local_svc or remote_svc
-
-                domains_str = ", ".join(svc.domains)
-                local_status = "[green]✓[/green]" if local_svc else "[red]✗[/red]"
-                remote_status = "[green]✓[/green]" if remote_svc else "[red]✗[/red]"
-
-                table.add_row(
-                    svc.name,
-                    svc.local_addr,
-                    str(svc.vps_port),
-                    domains_str,
-                    local_status,
-                    remote_status,
-                )
+            for row in rows:
+                table.add_row(*row)
 
             console.print(table)
 
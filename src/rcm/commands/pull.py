@@ -1,5 +1,6 @@
 """Pull command."""
 
+import hashlib
 from pathlib import Path
 from typing import Optional
 
@@ -8,11 +9,11 @@ import typer
 from ..config import load_config
 from ..parser import parse_caddyfile
 from ..ssh import get_server_connection
-from . import config_option, console
+from . import CONFIG_OPTION, console
 
 
 def pull_cmd(
-    config_path: Optional[str] = config_option(),
+    config_path: Optional[str] = CONFIG_OPTION,
 ) -> None:
     """Pull Caddyfile from remote VPS to local."""
     try:
@@ -20,15 +21,6 @@ def pull_cmd(
 
         local_caddyfile = Path(config.paths.caddyfile).expanduser()
 
-        # Check if local file exists and prompt for confirmation
-        if local_caddyfile.exists():
-            confirm = typer.confirm(
-                f"Local Caddyfile exists at {local_caddyfile}. Overwrite?"
-            )
-            if not confirm:
-                console.print("[yellow]Aborted.[/yellow]")
-                raise typer.Exit(0)
-
         # Download from remote
         console.print(f"Downloading from VPS ({config.server.host})...")
         server_conn = get_server_connection(config.server, config.paths.ssh_dir)
@@ -37,6 +29,21 @@ def pull_cmd(
         finally:
             server_conn.close()
 
+        if local_caddyfile.exists():
+            # Skip the write (and the prompt) if nothing changed
+            local_digest = hashlib.blake2b(local_caddyfile.read_bytes()).digest()
+            remote_digest = hashlib.blake2b(content.encode("utf-8")).digest()
+            if local_digest == remote_digest:
+                console.print(f"[green]✓[/green] {local_caddyfile} already up to date")
+                return
+
+            confirm = typer.confirm(
+                f"Local Caddyfile exists at {local_caddyfile}. Overwrite?"
+            )
+            if not confirm:
+                console.print("[yellow]Aborted.[/yellow]")
+                raise typer.Exit(0)
+
         # Ensure parent directory exists
         local_caddyfile.parent.mkdir(parents=True, exist_ok=True)
 
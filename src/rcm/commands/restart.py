@@ -1,16 +1,58 @@
 """Restart command."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import typer
 
-from ..config import load_config
+from ..config import Config, load_config
 from ..ssh import get_client_connection, get_server_connection
-from . import config_option, console
+from . import CONFIG_OPTION, console
+
+
+def _restart_server(config: Config) -> list[str]:
+    """Restart the VPS services, returning buffered console lines."""
+    lines = [f"[bold]Restarting VPS ({config.server.host})...[/bold]"]
+
+    server_conn = get_server_connection(config.server, config.paths.ssh_dir)
+    try:
+        # Restart rathole-server + caddy in one remote exec
+        server_ok, caddy_ok = server_conn.restart_services(
+            "rathole-server", config.server.caddy_compose_dir
+        )
+        if server_ok:
+            lines.append("  [green]✓[/green] Restarted rathole-server")
+        else:
+            lines.append("  [yellow]![/yellow] Failed to restart rathole-server")
+
+        if caddy_ok:
+            lines.append("  [green]✓[/green] Restarted caddy")
+        else:
+            lines.append("  [yellow]![/yellow] Failed to restart caddy")
+    finally:
+        server_conn.close()
+
+    return lines
+
+
+def _restart_client(config: Config) -> list[str]:
+    """Restart the home client service, returning buffered console lines."""
+    lines = [f"[bold]Restarting client ({config.client.host})...[/bold]"]
+
+    client_conn = get_client_connection(config.client, config.paths.ssh_dir)
+    try:
+        if client_conn.restart_service("rathole-client"):
+            lines.append("  [green]✓[/green] Restarted rathole-client")
+        else:
+            lines.append("  [yellow]![/yellow] Failed to restart rathole-client")
+    finally:
+        client_conn.close()
+
+    return lines
 
 
 def restart_cmd(
-    config_path: Optional[str] = config_option(),
+    config_path: Optional[str] = CONFIG_OPTION,
     server: bool = typer.Option(
         False,
         "--server",
@@ -32,32 +74,18 @@ def restart_cmd(
         restart_server = server or (not server and not client)
         restart_client = client or (not server and not client)
 
-        if restart_server:
-            console.print(f"[bold]Restarting VPS ({config.server.host})...[/bold]")
-            server_conn = get_server_connection(config.server, config.paths.ssh_dir)
-            try:
-                if server_conn.restart_service("rathole-server"):
-                    console.print("  [green]✓[/green] Restarted rathole-server")
-                else:
-                    console.print("  [yellow]![/yellow] Failed to restart rathole-server")
-
-                if server_conn.restart_caddy(config.server.caddy_compose_dir):
-                    console.print("  [green]✓[/green] Restarted caddy")
-                else:
-                    console.print("  [yellow]![/yellow] Failed to restart caddy")
-            finally:
-                server_conn.close()
-
-        if restart_client:
-            console.print(f"[bold]Restarting client ({config.client.host})...[/bold]")
-            client_conn = get_client_connection(config.client, config.paths.ssh_dir)
-            try:
-                if client_conn.restart_service("rathole-client"):
-                    console.print("  [green]✓[/green] Restarted rathole-client")
-                else:
-                    console.print("  [yellow]![/yellow] Failed to restart rathole-client")
-            finally:
-                client_conn.close()
+        # The two hosts are independent - restart them concurrently and
+        # print each host's buffered output once its future completes
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = []
+            if restart_server:
+                futures.append(executor.submit(_restart_server, config))
+            if restart_client:
+                futures.append(executor.submit(_restart_client, config))
+
+            for future in futures:
+                for line in future.result():
+                    console.print(line)
 
         console.print()
         console.print("[bold green]Done![/bold green]")
@@ -1,20 +1,36 @@
 """Status command."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import typer
-from rich.table import Table
 
 from ..config import load_config
-from ..ssh import get_client_connection, get_server_connection
-from . import config_option, console
+from ..ssh import SSHConnection, get_client_connection, get_server_connection
+from . import CONFIG_OPTION, console
+
+
+def _service_row(conn: SSHConnection, machine: str, service: str) -> tuple[str, str, str]:
+    """Probe a systemd service and return its status table row."""
+    is_active, status_text = conn.get_service_status(service)
+    style = "[green]● active[/green]" if is_active else f"[red]● {status_text}[/red]"
+    return machine, service, style
+
+
+def _docker_row(conn: SSHConnection, machine: str, compose_dir: str) -> tuple[str, str, str]:
+    """Probe the caddy docker service and return its status table row."""
+    is_running, status_text = conn.get_docker_status(compose_dir)
+    style = "[green]● running[/green]" if is_running else f"[red]● {status_text}[/red]"
+    return machine, "caddy", style
 
 
 def status_cmd(
-    config_path: Optional[str] = config_option(),
+    config_path: Optional[str] = CONFIG_OPTION,
 ) -> None:
     """Check tunnel status on server and client."""
     try:
+        from rich.table import Table
+
         config = load_config(config_path)
 
         table = Table(title="Tunnel Status")
@@ -22,31 +38,31 @@ def status_cmd(
         table.add_column("Service", style="white")
         table.add_column("Status", style="white")
 
-        # Check server
         console.print(f"Checking VPS ({config.server.host})...")
-        server_conn = get_server_connection(config.server, config.paths.ssh_dir)
-        try:
-            # rathole-server
-            is_active, status_text = server_conn.get_service_status("rathole-server")
-            status_style = "[green]● active[/green]" if is_active else f"[red]● {status_text}[/red]"
-            table.add_row("VPS", "rathole-server", status_style)
-
-            # caddy
-            is_running, status_text = server_conn.get_docker_status(config.server.caddy_compose_dir)
-            status_style = "[green]● running[/green]" if is_running else f"[red]● {status_text}[/red]"
-            table.add_row("VPS", "caddy", status_style)
-        finally:
-            server_conn.close()
-
-        # Check client
         console.print(f"Checking client ({config.client.host})...")
+
+        server_conn = get_server_connection(config.server, config.paths.ssh_dir)
         client_conn = get_client_connection(config.client, config.paths.ssh_dir)
         try:
-            # rathole-client
-            is_active, status_text = client_conn.get_service_status("rathole-client")
-            status_style = "[green]● active[/green]" if is_active else f"[red]● {status_text}[/red]"
-            table.add_row("Client", "rathole-client", status_style)
+            # The three probes are independent remote execs - run them
+            # concurrently instead of paying three round trips in series.
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                # Open both transports up front (also concurrently) so the
+                # probe threads only open channels on an established session.
+                # warm() is a no-op for daemon-backed connections.
+                list(executor.map(lambda c: c.warm(), (server_conn, client_conn)))
+
+                futures = [
+                    executor.submit(_service_row, server_conn, "VPS", "rathole-server"),
+                    executor.submit(
+                        _docker_row, server_conn, "VPS", config.server.caddy_compose_dir
+                    ),
+                    executor.submit(_service_row, client_conn, "Client", "rathole-client"),
+                ]
+                for future in futures:
+                    table.add_row(*future.result())
         finally:
+            server_conn.close()
             client_conn.close()
 
         console.print()
@@ -1,20 +1,136 @@
 """Sync command."""
 
+import hashlib
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.panel import Panel
 
-from ..config import load_config
+from ..config import Config, load_config
 from ..generators import generate_client_toml, generate_server_toml
 from ..parser import parse_caddyfile, parse_caddyfile_content
-from ..ssh import get_client_connection, get_server_connection
-from . import config_option, console
+from ..ssh import SSHConnection, get_client_connection, get_server_connection
+from . import CONFIG_OPTION, console
+
+
+def _deploy_server(
+    config: Config, server_conn: SSHConnection, server_toml: str, caddyfile_content: bytes
+) -> list[str]:
+    """Deploy Caddyfile + server.toml to the VPS and restart its services.
+
+    Reuses the connection sync_cmd already opened for the removed-services
+    check instead of dialing the VPS again.
+
+    Returns:
+        Console lines describing each step (printed by the caller, so
+        concurrent deploys don't interleave output).
+    """
+    lines = [f"[bold]Deploying to VPS ({config.server.host})...[/bold]"]
+
+    # Compare against remote hashes (one exec) so unchanged files are
+    # neither uploaded nor their services restarted
+    remote = server_conn.remote_hashes(
+        [config.server.caddyfile, config.server.rathole_config]
+    )
+    caddyfile_changed = (
+        remote.get(config.server.caddyfile)
+        != hashlib.sha256(caddyfile_content).hexdigest()
+    )
+    toml_changed = (
+        remote.get(config.server.rathole_config)
+        != hashlib.sha256(server_toml.encode("utf-8")).hexdigest()
+    )
+
+    uploads: list[tuple[str | bytes, str]] = []
+    if caddyfile_changed:
+        uploads.append((caddyfile_content, config.server.caddyfile))
+    if toml_changed:
+        uploads.append((server_toml, config.server.rathole_config))
+    if uploads:
+        # Upload everything that changed in one round trip
+        server_conn.bulk_upload_content(uploads)
+
+    lines.append(
+        "  [green]✓[/green] Uploaded Caddyfile"
+        if caddyfile_changed
+        else "  [dim]- Caddyfile unchanged[/dim]"
+    )
+    lines.append(
+        "  [green]✓[/green] Uploaded server.toml"
+        if toml_changed
+        else "  [dim]- server.toml unchanged[/dim]"
+    )
+
+    # Restart only the services whose config changed
+    if toml_changed and caddyfile_changed:
+        server_ok, caddy_ok = server_conn.restart_services(
+            "rathole-server", config.server.caddy_compose_dir
+        )
+    else:
+        server_ok = server_conn.restart_service("rathole-server") if toml_changed else None
+        caddy_ok = (
+            server_conn.restart_caddy(config.server.caddy_compose_dir)
+            if caddyfile_changed
+            else None
+        )
+
+    if server_ok is not None:
+        if server_ok:
+            lines.append("  [green]✓[/green] Restarted rathole-server")
+        else:
+            lines.append("  [yellow]![/yellow] Failed to restart rathole-server")
+    if caddy_ok is not None:
+        if caddy_ok:
+            lines.append("  [green]✓[/green] Restarted caddy")
+        else:
+            lines.append("  [yellow]![/yellow] Failed to restart caddy")
+    if not uploads:
+        lines.append("  [dim]Already up to date - skipped restarts[/dim]")
+
+    return lines
+
+
+def _deploy_client(config: Config, client_toml: str) -> list[str]:
+    """Deploy client.toml to the home client and restart rathole-client.
+
+    Returns:
+        Console lines describing each step (printed by the caller).
+    """
+    lines = [f"[bold]Deploying to client ({config.client.host})...[/bold]"]
+
+    client_conn = get_client_connection(config.client, config.paths.ssh_dir)
+    try:
+        # Skip the upload and restart when the deployed config is identical
+        remote = client_conn.remote_hashes([config.client.rathole_config])
+        toml_changed = (
+            remote.get(config.client.rathole_config)
+            != hashlib.sha256(client_toml.encode("utf-8")).hexdigest()
+        )
+
+        if not toml_changed:
+            lines.append("  [dim]- client.toml unchanged[/dim]")
+            lines.append("  [dim]Already up to date - skipped restart[/dim]")
+            return lines
+
+        # Upload client.toml
+        client_conn.bulk_upload_content([(client_toml, config.client.rathole_config)])
+        lines.append("  [green]✓[/green] Uploaded client.toml")
+
+        # Restart rathole-client
+        if client_conn.restart_service("rathole-client"):
+            lines.append("  [green]✓[/green] Restarted rathole-client")
+        else:
+            lines.append("  [yellow]![/yellow] Failed to restart rathole-client")
+    finally:
+        client_conn.close()
+
+    return lines
 
 
 def sync_cmd(
-    config_path: Optional[str] = config_option(),
+    config_path: Optional[str] = CONFIG_OPTION,
     dry_run: bool = typer.Option(
         False,
         "--dry-run",
@@ -67,7 +183,12 @@ def sync_cmd(
             console.print("[dim]Edit the local Caddyfile and run 'rcm sync' again to deploy changes.[/dim]")
             return
 
-        services = parse_caddyfile(config.paths.caddyfile)
+        # Read the Caddyfile once, as bytes - the parse wants text and the
+        # upload wants bytes, so decode here instead of reading twice
+        caddyfile_content = local_caddyfile.read_bytes()
+        services = parse_caddyfile(
+            config.paths.caddyfile, content=caddyfile_content.decode("utf-8")
+        )
 
         if not services:
             console.print("[yellow]No services found in Caddyfile.[/yellow]")
@@ -78,12 +199,20 @@ def sync_cmd(
 
         console.print(f"Parsed [cyan]{len(services)}[/cyan] services from Caddyfile")
 
-        # Check for removed services
-        local_names = {svc.name for svc in services}
+        # One server connection for the whole sync: the removed-services
+        # check and the deploy phase share it instead of re-dialing the VPS
         server_conn = get_server_connection(config.server, config.paths.ssh_dir)
+
+        # Check for removed services. If the remote Caddyfile hashes the
+        # same as ours, nothing can have been removed - skip the download
+        local_names = {svc.name for svc in services}
         try:
-            remote_content = server_conn.download_content(config.server.caddyfile)
-            remote_services = parse_caddyfile_content(remote_content)
+            remote_content = server_conn.download_content_if_different(
+                config.server.caddyfile, hashlib.sha256(caddyfile_content).hexdigest()
+            )
+            remote_services = (
+                parse_caddyfile_content(remote_content) if remote_content is not None else []
+            )
             remote_names = {svc.name for svc in remote_services}
 
             removed = remote_names - local_names
@@ -101,84 +230,56 @@ def sync_cmd(
                         raise typer.Exit(0)
         except FileNotFoundError:
             pass  # Remote doesn't exist yet, no services to remove
-        finally:
-            server_conn.close()
 
         # Generate configs
         server_toml = generate_server_toml(config, services)
         client_toml = generate_client_toml(config, services)
 
-        # Read Caddyfile content
-        caddyfile_content = Path(config.paths.caddyfile).expanduser().read_text()
-
         if dry_run:
-            # Show what would be deployed
-            from rich.markup import escape
+            # Show what would be deployed; skip Rich panels (and the markup
+            # escaping they require) when output is piped
+            if console.is_terminal:
+                from rich.markup import escape
+                from rich.panel import Panel
 
-            console.print()
-            console.print(
-                Panel(escape(server_toml), title="Generated server.toml", border_style="green")
-            )
-            console.print()
-            console.print(
-                Panel(escape(client_toml), title="Generated client.toml", border_style="blue")
-            )
+                console.print()
+                console.print(
+                    Panel(escape(server_toml), title="Generated server.toml", border_style="green")
+                )
+                console.print()
+                console.print(
+                    Panel(escape(client_toml), title="Generated client.toml", border_style="blue")
+                )
+            else:
+                sys.stdout.write(
+                    f"### Generated server.toml ###\n{server_toml}\n"
+                    f"### Generated client.toml ###\n{client_toml}\n"
+                )
             console.print()
             console.print("[yellow]Would deploy:[/yellow]")
             console.print(f"  VPS ({config.server.host}): Caddyfile, server.toml")
             console.print(f"  Client ({config.client.host}): client.toml")
             console.print()
             console.print("[dim]No changes deployed (dry-run mode)[/dim]")
+            server_conn.close()
             return
 
-        # Deploy to VPS
-        console.print()
-        console.print(f"[bold]Deploying to VPS ({config.server.host})...[/bold]")
-
-        server_conn = get_server_connection(config.server, config.paths.ssh_dir)
+        # Deploy to VPS and client concurrently - the two hosts are
+        # independent, so wall time is max(server, client) instead of sum.
         try:
-            # Upload Caddyfile
-            server_conn.upload_content(caddyfile_content, config.server.caddyfile)
-            console.print("  [green]✓[/green] Uploaded Caddyfile")
-
-            # Upload server.toml
-            server_conn.upload_content(server_toml, config.server.rathole_config)
-            console.print("  [green]✓[/green] Uploaded server.toml")
-
-            # Restart rathole-server
-            if server_conn.restart_service("rathole-server"):
-                console.print("  [green]✓[/green] Restarted rathole-server")
-            else:
-                console.print("  [yellow]![/yellow] Failed to restart rathole-server")
-
-            # Restart caddy
-            if server_conn.restart_caddy(config.server.caddy_compose_dir):
-                console.print("  [green]✓[/green] Restarted caddy")
-            else:
-                console.print("  [yellow]![/yellow] Failed to restart caddy")
-
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                server_future = executor.submit(
+                    _deploy_server, config, server_conn, server_toml, caddyfile_content
+                )
+                client_future = executor.submit(_deploy_client, config, client_toml)
+
+                for future in (server_future, client_future):
+                    console.print()
+                    for line in future.result():
+                        console.print(line)
         finally:
             server_conn.close()
 
-        # Deploy to Client
-        console.print()
-        console.print(f"[bold]Deploying to client ({config.client.host})...[/bold]")
-
-        client_conn = get_client_connection(config.client, config.paths.ssh_dir)
-        try:
-            # Upload client.toml
-            client_conn.upload_content(client_toml, config.client.rathole_config)
-            console.print("  [green]✓[/green] Uploaded client.toml")
-
-            # Restart rathole-client
-            if client_conn.restart_service("rathole-client"):
-                console.print("  [green]✓[/green] Restarted rathole-client")
-            else:
-                console.print("  [yellow]![/yellow] Failed to restart rathole-client")
-
-        finally:
-            client_conn.close()
-
         console.print()
         console.print(f"[bold green]All {len(services)} services synced![/bold green]")
 
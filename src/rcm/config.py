@@ -1,10 +1,15 @@
 """Configuration loading and Pydantic models."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Shared model behavior: configs are read-only once loaded (frozen also
+# makes them hashable for lru_cache), typos in config.yaml fail loudly,
+# and defaults are trusted as written instead of re-validated
+_MODEL_CONFIG = ConfigDict(frozen=True, extra="forbid", validate_default=False)
 
 
 DEFAULT_CONFIG_PATH = "~/.config/rcm/config.yaml"
@@ -13,6 +18,8 @@ DEFAULT_CONFIG_PATH = "~/.config/rcm/config.yaml"
 class PathsConfig(BaseModel):
     """Paths configuration."""
 
+    model_config = _MODEL_CONFIG
+
     caddyfile: str = Field(description="Path to local Caddyfile")
     ssh_dir: str = Field(default="~/.ssh", description="SSH keys directory")
 
@@ -20,6 +27,8 @@ class PathsConfig(BaseModel):
 class ServerConfig(BaseModel):
     """VPS server SSH configuration."""
 
+    model_config = _MODEL_CONFIG
+
     host: str = Field(description="VPS IP address")
     user: str = Field(default="root", description="SSH user")
     ssh_key: str = Field(default="/ssh/id_rsa", description="Path to SSH private key")
@@ -40,6 +49,8 @@ class ServerConfig(BaseModel):
 class ClientConfig(BaseModel):
     """Home client SSH configuration."""
 
+    model_config = _MODEL_CONFIG
+
     host: str = Field(description="Home machine IP address")
     user: str = Field(description="SSH user")
     ssh_key: str = Field(default="/ssh/id_rsa", description="Path to SSH private key")
@@ -52,6 +63,8 @@ class ClientConfig(BaseModel):
 class RatholeConfig(BaseModel):
     """Rathole tunnel configuration."""
 
+    model_config = _MODEL_CONFIG
+
     bind_port: int = Field(default=2333, description="Rathole bind port")
     token: str = Field(description="Shared token for authentication")
     server_private_key: str = Field(description="Server private key (stays on server)")
@@ -61,6 +74,8 @@ class RatholeConfig(BaseModel):
 class Config(BaseModel):
     """Root configuration model."""
 
+    model_config = _MODEL_CONFIG
+
     paths: PathsConfig
     server: ServerConfig
     client: ClientConfig
@@ -70,6 +85,9 @@ class Config(BaseModel):
 def load_config(config_path: Optional[str] = None) -> Config:
     """Load configuration from YAML file.
 
+    Results are memoized per (path, mtime), so repeated calls within one
+    process skip the YAML parse and Pydantic validation.
+
     Args:
         config_path: Path to config.yaml. If None, uses CONFIG_PATH env var
                      or defaults to ~/.config/rcm/config.yaml
@@ -90,7 +108,46 @@ def load_config(config_path: Optional[str] = None) -> Config:
             f"Create it with: mkdir -p ~/.config/rcm && cp config.yaml.example ~/.config/rcm/config.yaml"
         )
 
+    return _load_config_cached(str(path), path.stat().st_mtime_ns)
+
+
+def _fast_construct(data: dict) -> Config:
+    """Build a Config without running the validator pipeline.
+
+    model_construct trusts the data as-is (defaults still apply for
+    missing fields), so a typo'd config.yaml surfaces as an attribute
+    error downstream instead of a validation error here. Only used when
+    the user opts in via RCM_FAST_CONFIG.
+    """
+    return Config.model_construct(
+        paths=PathsConfig.model_construct(**data["paths"]),
+        server=ServerConfig.model_construct(**data["server"]),
+        client=ClientConfig.model_construct(**data["client"]),
+        rathole=RatholeConfig.model_construct(**data["rathole"]),
+    )
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int) -> Config:
+    """Parse and validate the config file, keyed by path and mtime."""
+    import os
+
+    # Deferred so `rcm --help` doesn't pay for the YAML parser
+    import yaml
+
+    # Prefer the libyaml C loader; wheels without it fall back to the
+    # pure-Python one (same safe_load semantics either way)
+    try:
+        loader = yaml.CSafeLoader
+    except AttributeError:
+        loader = yaml.SafeLoader
+
     with open(path) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=loader)
+
+    # Opt-in fast path: skip validation entirely for configs that are
+    # already known-good (e.g. scripted invocations in tight loops)
+    if os.environ.get("RCM_FAST_CONFIG"):
+        return _fast_construct(data)
 
     return Config(**data)
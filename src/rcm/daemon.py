@@ -0,0 +1,59 @@
+"""Long-lived daemon that keeps SSH connections open between rcm runs."""
+
+import base64
+import io
+import json
+import socketserver
+
+from .ssh import DAEMON_SOCKET, _get_pooled_connection
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Serve one newline-delimited JSON request per connection.
+
+    Request: {"host", "user", "key_path", "cmd", "stdin"?} where stdin is
+    base64-encoded bytes piped to the command. Response: {"ok", "stdout"}
+    or {"error"} if the exec itself failed.
+    """
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+
+        try:
+            request = json.loads(line)
+            conn = _get_pooled_connection(
+                request["host"], request["user"], request["key_path"]
+            )
+            stdin = request.get("stdin")
+            in_stream = io.BytesIO(base64.b64decode(stdin)) if stdin else None
+            ok, stdout = conn._run(request["cmd"], in_stream=in_stream)
+            response = {"ok": ok, "stdout": stdout}
+        except Exception as e:
+            response = {"error": str(e)}
+
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+def serve() -> None:
+    """Run the daemon until interrupted.
+
+    Remote execs arriving on the Unix socket are served from the
+    module-level connection pool, so the SSH handshake per host happens
+    once for the daemon's lifetime instead of once per CLI invocation.
+    """
+    DAEMON_SOCKET.parent.mkdir(parents=True, exist_ok=True)
+    if DAEMON_SOCKET.exists():
+        DAEMON_SOCKET.unlink()
+
+    with socketserver.ThreadingUnixStreamServer(
+        str(DAEMON_SOCKET), _RequestHandler
+    ) as server:
+        # Anyone who can write the socket can run commands as our SSH
+        # user - restrict it to the owner rather than trusting the umask
+        DAEMON_SOCKET.chmod(0o600)
+        try:
+            server.serve_forever()
+        finally:
+            DAEMON_SOCKET.unlink(missing_ok=True)
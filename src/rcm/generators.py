@@ -1,23 +1,38 @@
 """Template rendering for rathole config files."""
 
+from functools import lru_cache
 from pathlib import Path
-
-from jinja2 import Environment, FileSystemLoader
+from typing import TYPE_CHECKING
 
 from .config import Config
 from .parser import Service
 
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+
+
+@lru_cache(maxsize=1)
+def _get_template_env() -> "Environment":
+    """Get Jinja2 environment with templates directory, built once."""
+    # Deferred so jinja2 is only imported when something actually renders
+    from jinja2 import Environment, FileSystemLoader
 
-def _get_template_env() -> Environment:
-    """Get Jinja2 environment with templates directory."""
     templates_dir = Path(__file__).parent / "templates"
     return Environment(
         loader=FileSystemLoader(templates_dir),
         trim_blocks=True,
         lstrip_blocks=True,
+        # Templates ship inside the package and never change at runtime
+        auto_reload=False,
     )
 
 
+@lru_cache(maxsize=None)
+def _get_template(name: str) -> "Template":
+    """Get a template compiled once per process."""
+    return _get_template_env().get_template(name)
+
+
 def generate_server_toml(config: Config, services: list[Service]) -> str:
     """Generate server.toml content from config and services.
 
@@ -28,8 +43,7 @@ def generate_server_toml(config: Config, services: list[Service]) -> str:
     Returns:
         Rendered server.toml content
     """
-    env = _get_template_env()
-    template = env.get_template("server.toml.j2")
+    template = _get_template("server.toml.j2")
 
     return template.render(
         rathole=config.rathole,
@@ -47,8 +61,7 @@ def generate_client_toml(config: Config, services: list[Service]) -> str:
     Returns:
         Rendered client.toml content
     """
-    env = _get_template_env()
-    template = env.get_template("client.toml.j2")
+    template = _get_template("client.toml.j2")
 
     return template.render(
         server=config.server,
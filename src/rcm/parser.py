@@ -5,8 +5,23 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-
-@dataclass
+# Every construct the parser cares about, as one alternation so the whole
+# file is scanned in a single C-level regex pass:
+#   comment  # service_name: local_addr
+#   domain block start  domain.com {
+#   reverse_proxy [https://]127.0.0.1:PORT or localhost:PORT
+#   bare braces (to track block nesting)
+_TOKEN_RE = re.compile(
+    r"(?m)"
+    r"^[ \t]*#[ \t]*(?P<name>\w+):[ \t]*(?P<addr>.+?)[ \t]*\r?$"
+    r"|^[ \t]*(?P<domain>[a-zA-Z0-9][a-zA-Z0-9.-]+)[ \t]*\{"
+    r"|reverse_proxy\s+(?:https?://)?(?:127\.0\.0\.1|localhost):(?P<port>\d+)"
+    r"|(?P<open>\{)"
+    r"|(?P<close>\})"
+)
+
+
+@dataclass(slots=True)
 class Service:
     """Represents a service extracted from Caddyfile."""
 
@@ -21,7 +36,7 @@ class Service:
         return self.domains[0] if self.domains else ""
 
 
-def parse_caddyfile(caddyfile_path: str) -> list[Service]:
+def parse_caddyfile(caddyfile_path: str, content: Optional[str] = None) -> list[Service]:
     """Parse Caddyfile and extract service definitions.
 
     Expected format:
@@ -36,17 +51,29 @@ def parse_caddyfile(caddyfile_path: str) -> list[Service]:
 
     Args:
         caddyfile_path: Path to the Caddyfile
+        content: File content, if the caller already read it (avoids a
+            second read of the same file)
 
     Returns:
         List of Service objects
     """
+    # Imported here to avoid a circular import (parser_cache needs Service)
+    from .parser_cache import load_cached, store_cached
+
     path = Path(caddyfile_path).expanduser()
 
-    if not path.exists():
+    if content is None and not path.exists():
         raise FileNotFoundError(f"Caddyfile not found: {path}")
 
-    content = path.read_text()
-    return parse_caddyfile_content(content)
+    cached = load_cached(path, content)
+    if cached is not None:
+        return cached
+
+    if content is None:
+        content = path.read_text()
+    services = parse_caddyfile_content(content)
+    store_cached(path, content, services)
+    return services
 
 
 def parse_caddyfile_content(content: str) -> list[Service]:
@@ -56,60 +83,55 @@ def parse_caddyfile_content(content: str) -> list[Service]:
         content: Caddyfile content as string
 
     Returns:
-        List of Service objects (deduplicated by name)
+        List of Service objects (deduplicated by name, sorted by name)
     """
     # Track services by name to deduplicate
     services_by_name: dict[str, Service] = {}
-    lines = content.split("\n")
-
-    # Pattern for service comment: # service_name: local_addr
-    comment_pattern = re.compile(r"^#\s*(\w+):\s*(.+?)\s*$")
-
-    # Pattern for domain block start: domain.com {
-    domain_pattern = re.compile(r"^([a-zA-Z0-9][a-zA-Z0-9.-]+)\s*\{")
-
-    # Pattern for reverse_proxy: reverse_proxy [https://]127.0.0.1:PORT or localhost:PORT
-    proxy_pattern = re.compile(r"reverse_proxy\s+(?:https?://)?(?:127\.0\.0\.1|localhost):(\d+)")
 
     pending_service: Optional[tuple[str, str]] = None  # (name, local_addr)
-
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-
-        # Check for service comment
-        comment_match = comment_pattern.match(line)
-        if comment_match:
-            pending_service = (comment_match.group(1), comment_match.group(2))
-            i += 1
+    current_block: Optional[tuple[str, str, str]] = None  # (name, local_addr, domain)
+    vps_port: Optional[int] = None
+    brace_depth = 0
+    block_depth = 0  # Depth at which current_block was opened
+
+    # Single pass: the combined pattern yields every comment, block start,
+    # reverse_proxy directive and brace in document order, so there is no
+    # per-line Python loop or inner block re-scan
+    for match in _TOKEN_RE.finditer(content):
+        if match.group("name"):
+            # Comments inside the block being collected belong to it, not
+            # to the next service
+            if current_block is None:
+                pending_service = (match.group("name"), match.group("addr"))
             continue
 
-        # Check for domain block start
-        domain_match = domain_pattern.match(line)
-        if domain_match and pending_service:
-            domain = domain_match.group(1)
-            name, local_addr = pending_service
-
-            # Find reverse_proxy port in this block
-            vps_port = None
-            brace_count = 1
-            j = i + 1
-
-            while j < len(lines) and brace_count > 0:
-                block_line = lines[j]
-                brace_count += block_line.count("{") - block_line.count("}")
+        if match.group("domain"):
+            if current_block is None and pending_service:
+                name, local_addr = pending_service
+                current_block = (name, local_addr, match.group("domain"))
+                vps_port = None
+                block_depth = brace_depth
+            # A domain without a pending service comment resets the state
+            pending_service = None
+            brace_depth += 1
+            continue
 
-                proxy_match = proxy_pattern.search(block_line)
-                if proxy_match and vps_port is None:
-                    vps_port = int(proxy_match.group(1))
+        if match.group("port"):
+            if current_block is not None and vps_port is None:
+                vps_port = int(match.group("port"))
+            continue
 
-                j += 1
+        if match.group("open"):
+            brace_depth += 1
+            continue
 
+        # Closing brace
+        brace_depth -= 1
+        if current_block is not None and brace_depth == block_depth:
+            name, local_addr, domain = current_block
             if vps_port is not None:
-                if name in services_by_name:
-                    # Add domain to existing service
-                    services_by_name[name].domains.append(domain)
-                else:
+                svc = services_by_name.get(name)
+                if svc is None:
                     # Create new service
                     services_by_name[name] = Service(
                         name=name,
@@ -117,15 +139,9 @@ def parse_caddyfile_content(content: str) -> list[Service]:
                         domains=[domain],
                         vps_port=vps_port,
                     )
+                else:
+                    # Add domain to existing service
+                    svc.domains.append(domain)
+            current_block = None
 
-            pending_service = None
-            i = j
-            continue
-
-        # If we hit a domain without a pending service comment, skip it
-        if domain_match:
-            pending_service = None
-
-        i += 1
-
-    return list(services_by_name.values())
+    return sorted(services_by_name.values(), key=lambda svc: svc.name)
@@ -0,0 +1,146 @@
+"""On-disk cache of parsed Caddyfile service lists."""
+
+import hashlib
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Optional
+
+from .parser import Service
+
+CACHE_DIR = Path("~/.cache/rcm").expanduser()
+
+# Entries untouched for this long are deleted on the next write
+MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+
+
+def _content_hash(content: str) -> str:
+    """Hash Caddyfile content for cache validation."""
+    return hashlib.blake2b(content.encode("utf-8")).hexdigest()
+
+
+def _cache_file(key: str) -> Path:
+    return CACHE_DIR / f"caddyfile-{key}.pkl"
+
+
+def _read_entry(cache_path: Path) -> Optional[dict]:
+    """Load a cache entry, returning None on any miss or corruption."""
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError, AttributeError):
+        return None
+
+
+def _write_entry(cache_path: Path, entry: dict) -> None:
+    """Store a cache entry; caching is best-effort, so errors are ignored."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write to a sibling temp file and rename, so a concurrent reader
+        # never sees a half-written pickle
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(entry, f, protocol=5)
+        os.replace(tmp_path, cache_path)
+        _purge_stale()
+    except OSError:
+        pass
+
+
+def _purge_stale() -> None:
+    """Delete cache entries that haven't been touched in over a week."""
+    cutoff = time.time() - MAX_AGE_SECONDS
+    try:
+        for stale in CACHE_DIR.glob("caddyfile-*.pkl"):
+            if stale.stat().st_mtime < cutoff:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def load_cached(path: Path, content: Optional[str] = None) -> Optional[list[Service]]:
+    """Return the cached service list for a Caddyfile, or None on miss.
+
+    The entry is valid if mtime and size are unchanged; if the file was
+    touched but its content hash still matches, the entry is reused too.
+
+    Args:
+        path: Resolved path to the local Caddyfile
+        content: File content, if the caller already read it (spares the
+            hash fallback a second read)
+
+    Returns:
+        Cached list of Service objects, or None if the cache is stale
+    """
+    key = hashlib.sha1(str(path).encode("utf-8")).hexdigest()
+    entry = _read_entry(_cache_file(key))
+    if entry is None:
+        return None
+
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+
+    if entry["mtime"] == st.st_mtime_ns and entry["size"] == st.st_size:
+        return entry["services"]
+
+    # mtime changed (e.g. touch, re-download) - fall back to the content hash
+    if entry["size"] == st.st_size:
+        if content is None:
+            try:
+                content = path.read_text()
+            except OSError:
+                return None
+        if entry["hash"] == _content_hash(content):
+            return entry["services"]
+
+    return None
+
+
+def store_cached(path: Path, content: str, services: list[Service]) -> None:
+    """Store the parsed service list for a local Caddyfile.
+
+    Args:
+        path: Resolved path to the local Caddyfile
+        content: The Caddyfile content that was parsed
+        services: Parse result to cache
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return
+    key = hashlib.sha1(str(path).encode("utf-8")).hexdigest()
+    _write_entry(
+        _cache_file(key),
+        {
+            "mtime": st.st_mtime_ns,
+            "size": st.st_size,
+            "hash": _content_hash(content),
+            "services": services,
+        },
+    )
+
+
+def load_cached_content(content: str) -> Optional[list[Service]]:
+    """Return the cached parse of (e.g. remote) content, keyed by its hash.
+
+    Args:
+        content: Caddyfile content as string
+
+    Returns:
+        Cached list of Service objects, or None on miss
+    """
+    entry = _read_entry(_cache_file(f"content-{_content_hash(content)}"))
+    if entry is None:
+        return None
+    return entry["services"]
+
+
+def store_cached_content(content: str, services: list[Service]) -> None:
+    """Store the parse of content that has no local file (e.g. remote)."""
+    _write_entry(
+        _cache_file(f"content-{_content_hash(content)}"),
+        {"services": services},
+    )
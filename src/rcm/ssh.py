@@ -1,14 +1,72 @@
 """SSH operations using Fabric."""
 
+import atexit
+import json
+import os
+import threading
 from pathlib import Path
-from typing import Optional
-
-from fabric import Connection
-from rich.console import Console
+from typing import TYPE_CHECKING, Optional
 
 from .config import ClientConfig, ServerConfig
 
-console = Console()
+if TYPE_CHECKING:
+    from fabric import Connection
+
+# Socket of the optional long-lived daemon (`rcm daemon`). When it is up,
+# connection factories proxy remote execs through it so separate CLI
+# invocations share its open SSH sessions.
+DAEMON_SOCKET = Path("~/.cache/rcm/rcmd.sock").expanduser()
+
+# Per-process connection pool, keyed by (host, user, key_path). Pooled
+# connections survive close() so every command in the process pays the
+# SSH handshake at most once per host (set RCM_DISABLE_SSH_MUX to opt out).
+_pool: dict[tuple[str, str, str], "SSHConnection"] = {}
+
+# Guards pool get-or-create: the daemon serves requests on concurrent
+# threads, and two for the same host must not each dial their own session
+_pool_lock = threading.Lock()
+
+
+def _pooling_enabled() -> bool:
+    """Whether connection pooling is active (RCM_DISABLE_SSH_MUX opts out)."""
+    return not os.environ.get("RCM_DISABLE_SSH_MUX")
+
+
+def _daemon_available() -> bool:
+    """Whether a running rcm daemon is reachable (RCM_NO_DAEMON opts out)."""
+    import socket
+
+    if os.environ.get("RCM_NO_DAEMON") or not DAEMON_SOCKET.exists():
+        return False
+    try:
+        with socket.socket(socket.AF_UNIX) as sock:
+            sock.settimeout(0.2)
+            sock.connect(str(DAEMON_SOCKET))
+        return True
+    except OSError:
+        return False
+
+
+def _get_pooled_connection(host: str, user: str, key_path: str) -> "SSHConnection":
+    """Return the pooled connection for a host, creating it on first use."""
+    key = (host, user, key_path)
+    with _pool_lock:
+        conn = _pool.get(key)
+        if conn is None:
+            conn = SSHConnection(host=host, user=user, key_path=key_path)
+            conn._pooled = True
+            _pool[key] = conn
+    return conn
+
+
+@atexit.register
+def _close_pool() -> None:
+    """Tear down all pooled connections at interpreter exit."""
+    with _pool_lock:
+        conns = list(_pool.values())
+        _pool.clear()
+    for conn in conns:
+        conn._teardown()
 
 
 class SSHConnection:
@@ -25,18 +83,112 @@ class SSHConnection:
         self.host = host
         self.user = user
         self.key_path = Path(key_path).expanduser()
-        self._conn: Optional[Connection] = None
-
-    def connect(self) -> Connection:
-        """Establish SSH connection."""
+        self._conn: Optional["Connection"] = None
+        self._conn_lock = threading.Lock()
+        self._pooled = False
+        self._home: Optional[str] = None
+
+    # SSH window/packet sizes for new channels. Paramiko's 32 KiB defaults
+    # throttle transfers on high-latency links (the HPN-SSH problem); a
+    # 2 MiB window and 256 KiB packets keep the pipe full.
+    WINDOW_SIZE = 2 * 1024 * 1024
+    MAX_PACKET_SIZE = 256 * 1024
+
+    # Bulk uploads at or above this size are gzipped on the wire; below it
+    # the compression setup costs more than the bytes it saves.
+    COMPRESS_MIN_BYTES = 4 * 1024
+
+    def connect(self) -> "Connection":
+        """Establish SSH connection.
+
+        Thread-safe: pooled connections are shared across handler threads
+        in the daemon, so init is double-checked under a lock and the
+        connection is published only once fully opened.
+        """
         if self._conn is None:
-            self._conn = Connection(
-                host=self.host,
-                user=self.user,
-                connect_kwargs={"key_filename": str(self.key_path)},
-            )
+            with self._conn_lock:
+                if self._conn is None:
+                    # Deferred: fabric pulls in paramiko/cryptography, which
+                    # dominate import time for commands that never dial out
+                    from fabric import Connection
+
+                    conn = Connection(
+                        host=self.host,
+                        user=self.user,
+                        connect_kwargs={
+                            "key_filename": str(self.key_path),
+                            "banner_timeout": 30,
+                        },
+                    )
+                    # Open eagerly so the tuned sizes apply to every channel
+                    conn.open()
+                    transport = conn.transport
+                    if transport is not None:
+                        transport.default_window_size = self.WINDOW_SIZE
+                        transport.default_max_packet_size = self.MAX_PACKET_SIZE
+                    self._conn = conn
         return self._conn
 
+    def warm(self) -> None:
+        """Eagerly open the SSH transport.
+
+        Lets callers pay the handshake up front (e.g. concurrently for
+        several hosts) so later calls only open channels.
+        """
+        self.connect()
+
+    def _run(self, cmd: str, in_stream=None) -> tuple[bool, str]:
+        """Execute a command on the remote host.
+
+        Every remote exec funnels through here, so subclasses (e.g. the
+        daemon proxy) only have to override this one primitive.
+
+        Args:
+            cmd: Command to run
+            in_stream: Optional binary file object piped to stdin
+
+        Returns:
+            Tuple of (ok, stdout)
+        """
+        conn = self.connect()
+        kwargs = {"hide": True, "warn": True}
+        if in_stream is not None:
+            kwargs["in_stream"] = in_stream
+        result = conn.run(cmd, **kwargs)
+        return result.ok, result.stdout
+
+    def _expand(self, path: str) -> str:
+        """Expand a leading ~ using the remote $HOME, probed at most once.
+
+        Args:
+            path: Remote path, possibly starting with ~
+
+        Returns:
+            Path with ~ replaced by the remote home directory
+        """
+        if not path.startswith("~"):
+            return path
+        if self._home is None:
+            _ok, stdout = self._run("echo $HOME")
+            self._home = stdout.strip()
+        return path.replace("~", self._home, 1)
+
+    def run_script(self, script: str) -> tuple[bool, str]:
+        """Run a multi-line shell script in a single remote exec.
+
+        Pipes the script to `bash -s` on stdin, so it needs no shell
+        quoting no matter what the script contains.
+
+        Args:
+            script: Shell script body
+
+        Returns:
+            Tuple of (ok, stdout)
+        """
+        import io
+
+        return self._run("bash -s", in_stream=io.BytesIO(script.encode("utf-8")))
+
     def upload_content(self, content: str, remote_path: str) -> None:
         """Upload string content to remote file.
 
@@ -44,17 +196,78 @@ class SSHConnection:
             content: File content as string
             remote_path: Remote file path
         """
+        self.bulk_upload_content([(content, remote_path)])
+
+    def bulk_upload_content(self, files: list[tuple[str | bytes, str]]) -> None:
+        """Upload multiple files in a single remote exec.
+
+        Builds an in-memory tarball of all files and pipes it into one
+        `tar xf -` process on the remote host, so the whole batch costs a
+        single SSH round trip instead of one per file.
+
+        Args:
+            files: List of (content, remote_path) tuples; str content is
+                encoded as UTF-8, bytes are sent as-is
+        """
         import io
+        import tarfile
+        import time
+
+        entries: list[tuple[str, bytes]] = []
+        for content, remote_path in files:
+            data = content.encode("utf-8") if isinstance(content, str) else content
+            entries.append((self._expand(remote_path), data))
+
+        # Config text compresses well even at the fastest gzip level, so
+        # larger batches go over the wire gzipped
+        compress = sum(len(data) for _path, data in entries) >= self.COMPRESS_MIN_BYTES
+        now = int(time.time())
+
+        buf = io.BytesIO()
+        if compress:
+            tar = tarfile.open(fileobj=buf, mode="w:gz", compresslevel=1)
+        else:
+            tar = tarfile.open(fileobj=buf, mode="w")
+        with tar:
+            for remote_path, data in entries:
+                info = tarfile.TarInfo(name=remote_path.lstrip("/"))
+                info.size = len(data)
+                info.mtime = now
+                tar.addfile(info, io.BytesIO(data))
+
+        buf.seek(0)
+        # 2>&1 so tar's error lands in stdout, which _run captures
+        ok, stdout = self._run(
+            "tar xzf - -C / 2>&1" if compress else "tar xf - -C / 2>&1", in_stream=buf
+        )
+        if not ok:
+            paths = ", ".join(path for path, _data in entries)
+            raise RuntimeError(f"Upload failed for {paths}: {stdout.strip()}")
 
-        conn = self.connect()
-        # Expand ~ in remote path
-        if remote_path.startswith("~"):
-            result = conn.run("echo $HOME", hide=True)
-            home = result.stdout.strip()
-            remote_path = remote_path.replace("~", home, 1)
+    def remote_hashes(self, remote_paths: list[str]) -> dict[str, str]:
+        """Fetch sha256 digests of remote files in a single exec.
+
+        Args:
+            remote_paths: Remote file paths (~ is expanded)
+
+        Returns:
+            Mapping of the given paths to hex digests; paths that don't
+            exist remotely are simply absent
+        """
+        # Map expanded paths (as sha256sum will echo them) back to the
+        # caller's originals
+        expanded = {self._expand(path): path for path in remote_paths}
 
-        # Use a temp file approach
-        conn.put(io.StringIO(content), remote=remote_path)
+        _ok, stdout = self._run(
+            "sha256sum " + " ".join(expanded) + " 2>/dev/null || true"
+        )
+
+        hashes: dict[str, str] = {}
+        for line in stdout.splitlines():
+            parts = line.split(None, 1)  # "digest  path"
+            if len(parts) == 2 and parts[1] in expanded:
+                hashes[expanded[parts[1]]] = parts[0]
+        return hashes
 
     def run_command(self, cmd: str, hide: bool = True) -> str:
         """Run a command on the remote host.
@@ -66,8 +279,12 @@ class SSHConnection:
         Returns:
             Command stdout
         """
+        if hide:
+            _ok, stdout = self._run(cmd)
+            return stdout
+
         conn = self.connect()
-        result = conn.run(cmd, hide=hide, warn=True)
+        result = conn.run(cmd, hide=False, warn=True)
         return result.stdout
 
     def download_content(self, remote_path: str) -> str:
@@ -79,30 +296,48 @@ class SSHConnection:
         Returns:
             File content as string
         """
-        conn = self.connect()
-        # Expand ~ in remote path
-        if remote_path.startswith("~"):
-            result = conn.run("echo $HOME", hide=True)
-            home = result.stdout.strip()
-            remote_path = remote_path.replace("~", home, 1)
-
-        result = conn.run(f"cat {remote_path}", hide=True, warn=True)
-        if not result.ok:
+        remote_path = self._expand(remote_path)
+
+        ok, stdout = self._run(f"cat {remote_path}")
+        if not ok:
             raise FileNotFoundError(f"Remote file not found: {remote_path}")
-        return result.stdout
+        return stdout
 
-    def restart_service(self, service_name: str) -> bool:
+    def download_content_if_different(
+        self, remote_path: str, local_sha256: str
+    ) -> Optional[str]:
+        """Download a remote file only if it differs from a local digest.
+
+        Costs one cheap hash exec when the file is unchanged, instead of
+        shipping the whole file over the wire just to compare it.
+
+        Args:
+            remote_path: Remote file path
+            local_sha256: Hex sha256 digest of the local copy
+
+        Returns:
+            File content as string, or None if the remote file matches
+            the digest
+        """
+        remote = self.remote_hashes([remote_path])
+        if remote.get(remote_path) == local_sha256:
+            return None
+        return self.download_content(remote_path)
+
+    def restart_service(self, service_name: str, no_block: bool = False) -> bool:
         """Restart a systemd service.
 
         Args:
             service_name: Name of the systemd service
+            no_block: Don't wait for the restart to finish (the caller is
+                expected to verify with `systemctl is-active` later)
 
         Returns:
             True if successful
         """
-        conn = self.connect()
-        result = conn.run(f"sudo systemctl restart {service_name}", hide=True, warn=True)
-        return result.ok
+        flag = " --no-block" if no_block else ""
+        ok, _stdout = self._run(f"sudo systemctl restart{flag} {service_name}")
+        return ok
 
     def restart_caddy(self, compose_dir: str) -> bool:
         """Restart Caddy via docker compose.
@@ -113,19 +348,48 @@ class SSHConnection:
         Returns:
             True if successful
         """
-        conn = self.connect()
-        # Expand ~ in path
-        if compose_dir.startswith("~"):
-            result = conn.run("echo $HOME", hide=True)
-            home = result.stdout.strip()
-            compose_dir = compose_dir.replace("~", home, 1)
-
-        result = conn.run(
-            f"cd {compose_dir} && docker compose restart",
-            hide=True,
-            warn=True,
+        compose_dir = self._expand(compose_dir)
+
+        ok, _stdout = self._run(f"cd {compose_dir} && docker compose restart")
+        return ok
+
+    def restart_services(self, service_name: str, compose_dir: str) -> tuple[bool, bool]:
+        """Restart a systemd service and caddy in a single remote exec.
+
+        Runs both restarts in one SSH channel instead of two, saving a
+        full round trip. The systemd restart is kicked off with
+        --no-block so it runs while docker compose restarts caddy, then
+        the service is polled until active; per-step success is recovered
+        from echoed sentinels. The poll alone can't tell a fresh instance
+        from an old one that never stopped, so the restart command's own
+        exit status is captured too. The remote shell expands any ~ in
+        compose_dir.
+
+        Args:
+            service_name: Name of the systemd service
+            compose_dir: Directory containing docker-compose.yml
+
+        Returns:
+            Tuple of (service_ok, caddy_ok)
+        """
+        script = (
+            f"sudo systemctl restart --no-block {service_name} && echo __rcm_kick_ok__\n"
+            f"cd {compose_dir} && docker compose restart && echo __rcm_caddy_ok__\n"
+            # The docker restart above usually gives systemd enough time;
+            # poll briefly in case the unit is still activating
+            f"for _ in 1 2 3 4 5; do\n"
+            f'    if [ "$(systemctl is-active {service_name})" = active ]; then\n'
+            f"        echo __rcm_service_ok__\n"
+            f"        break\n"
+            f"    fi\n"
+            f"    sleep 1\n"
+            f"done\n"
+        )
+        _ok, stdout = self.run_script(script)
+        return (
+            "__rcm_kick_ok__" in stdout and "__rcm_service_ok__" in stdout,
+            "__rcm_caddy_ok__" in stdout,
         )
-        return result.ok
 
     def get_service_status(self, service_name: str) -> tuple[bool, str]:
         """Get systemd service status.
@@ -136,13 +400,10 @@ class SSHConnection:
         Returns:
             Tuple of (is_active, status_text)
         """
-        conn = self.connect()
-        result = conn.run(
-            f"systemctl is-active {service_name} 2>/dev/null || echo 'inactive'",
-            hide=True,
-            warn=True,
+        _ok, stdout = self._run(
+            f"systemctl is-active {service_name} 2>/dev/null || echo 'inactive'"
         )
-        status = result.stdout.strip()
+        status = stdout.strip()
         is_active = status == "active"
         return is_active, status
 
@@ -156,27 +417,92 @@ class SSHConnection:
         Returns:
             Tuple of (is_running, status_text)
         """
-        conn = self.connect()
-        # Expand ~ in path
-        if compose_dir.startswith("~"):
-            result = conn.run("echo $HOME", hide=True)
-            home = result.stdout.strip()
-            compose_dir = compose_dir.replace("~", home, 1)
-
-        result = conn.run(
-            f"cd {compose_dir} && docker compose ps --format '{{{{.State}}}}' {service_name} 2>/dev/null || echo 'not found'",
-            hide=True,
-            warn=True,
+        compose_dir = self._expand(compose_dir)
+
+        ok, stdout = self._run(
+            f"cd {compose_dir} && docker compose ps --format json {service_name} 2>/dev/null"
         )
-        status = result.stdout.strip()
-        is_running = status == "running"
-        return is_running, status
+        stdout = stdout.strip()
+        if not ok or not stdout:
+            return False, "not found"
+
+        # docker compose emits one JSON object per line (older versions
+        # emit a single list instead)
+        try:
+            data = json.loads(stdout.splitlines()[0])
+            if isinstance(data, list):
+                data = data[0] if data else {}
+            status = str(data.get("State", "unknown")).lower()
+        except (json.JSONDecodeError, AttributeError):
+            return False, "unknown"
+
+        return status == "running", status
 
     def close(self) -> None:
-        """Close the SSH connection."""
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        """Close the SSH connection.
+
+        Pooled connections are kept open for reuse within the process and
+        torn down at interpreter exit instead.
+        """
+        if self._pooled:
+            return
+        self._teardown()
+
+    def _teardown(self) -> None:
+        """Actually close the underlying connection."""
+        with self._conn_lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+
+class DaemonConnection(SSHConnection):
+    """SSH operations proxied through the local rcm daemon.
+
+    The daemon (started with `rcm daemon`) keeps pooled SSH sessions open
+    between CLI invocations, so commands proxied through it skip the SSH
+    handshake entirely.
+    """
+
+    def _run(self, cmd: str, in_stream=None) -> tuple[bool, str]:
+        """Forward a remote exec to the daemon over its Unix socket."""
+        import base64
+        import socket
+
+        request = {
+            "host": self.host,
+            "user": self.user,
+            "key_path": str(self.key_path),
+            "cmd": cmd,
+        }
+        if in_stream is not None:
+            request["stdin"] = base64.b64encode(in_stream.read()).decode("ascii")
+
+        with socket.socket(socket.AF_UNIX) as sock:
+            sock.connect(str(DAEMON_SOCKET))
+            stream = sock.makefile("rwb")
+            stream.write(json.dumps(request).encode("utf-8") + b"\n")
+            stream.flush()
+            response = json.loads(stream.readline())
+
+        if "error" in response:
+            raise RuntimeError(f"rcm daemon error: {response['error']}")
+        return response["ok"], response["stdout"]
+
+    def warm(self) -> None:
+        """Nothing to open - the daemon already holds the SSH sessions."""
+
+    def close(self) -> None:
+        """Nothing to close - the daemon owns the SSH sessions."""
+
+
+def _make_connection(host: str, user: str, key_path: str) -> SSHConnection:
+    """Build a connection: daemon proxy if one is running, else pooled/direct."""
+    if _daemon_available():
+        return DaemonConnection(host=host, user=user, key_path=key_path)
+    if _pooling_enabled():
+        return _get_pooled_connection(host, user, key_path)
+    return SSHConnection(host=host, user=user, key_path=key_path)
 
 
 def get_server_connection(config: ServerConfig, ssh_dir: str) -> SSHConnection:
@@ -190,11 +516,7 @@ def get_server_connection(config: ServerConfig, ssh_dir: str) -> SSHConnection:
         SSHConnection instance
     """
     key_path = f"{ssh_dir}/{config.ssh_key}"
-    return SSHConnection(
-        host=config.host,
-        user=config.user,
-        key_path=key_path,
-    )
+    return _make_connection(config.host, config.user, key_path)
 
 
 def get_client_connection(config: ClientConfig, ssh_dir: str) -> SSHConnection:
@@ -208,8 +530,4 @@ def get_client_connection(config: ClientConfig, ssh_dir: str) -> SSHConnection:
         SSHConnection instance
     """
     key_path = f"{ssh_dir}/{config.ssh_key}"
-    return SSHConnection(
-        host=config.host,
-        user=config.user,
-        key_path=key_path,
-    )
+    return _make_connection(config.host, config.user, key_path)